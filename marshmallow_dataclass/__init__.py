@@ -37,20 +37,21 @@ Full example::
 
 import collections.abc
 import dataclasses
-import inspect
 import sys
-import threading
 import types
 import warnings
-from enum import Enum
-from functools import lru_cache, partial
+from contextvars import ContextVar
+from enum import Enum, EnumMeta
+from functools import partial
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
+    Final,
     FrozenSet,
-    Generic,
     List,
+    Literal,
     Mapping,
     NewType as typing_NewType,
     Optional,
@@ -68,7 +69,9 @@ from typing import (
 import marshmallow
 import typing_extensions
 import typing_inspect
+from typing_extensions import get_args, get_origin
 
+from marshmallow_dataclass import collection_field, union_field
 from marshmallow_dataclass.lazy_class_attribute import lazy_class_attribute
 
 if sys.version_info >= (3, 9):
@@ -85,12 +88,17 @@ else:
 __all__ = ["dataclass", "add_schema", "class_schema", "field_for_schema", "NewType"]
 
 NoneType = type(None)
+# Origins of Union[...] and, since python 3.10, of X | Y
+_UNION_ORIGINS: Tuple[Any, ...] = (
+    (Union, types.UnionType) if sys.version_info >= (3, 10) else (Union,)
+)
 _U = TypeVar("_U")
 
 # Whitelist of dataclass members that will be copied to generated schema.
 MEMBERS_WHITELIST: Set[str] = {"Meta"}
 
-# Max number of generated schemas that class_schema keeps of generated schemas. Removes duplicates.
+# Max number of generated schemas memoized per class: one per base schema and
+# namespaces passed to class_schema. The oldest ones are evicted first.
 MAX_CLASS_SCHEMA_CACHE_SIZE = 1024
 
 
@@ -118,15 +126,12 @@ def _maybe_get_callers_frame(
 
     """
     try:
-        frame = inspect.currentframe()
-        for _ in range(stacklevel + 1):
-            if frame is None:
-                return None
-            frame = frame.f_back
-
-        if frame is None:
-            return None
+        frame = sys._getframe(stacklevel + 1)
+    except ValueError:
+        # The call stack is not that deep
+        return None
 
+    try:
         globalns = getattr(sys.modules.get(cls.__module__), "__dict__", None)
         if frame.f_locals is globalns:
             # Locals are the globals
@@ -455,66 +460,128 @@ def class_schema(
     """
     if not dataclasses.is_dataclass(clazz):
         clazz = dataclasses.dataclass(clazz)
+    # Only namespaces passed by the caller tell generated schemas apart. The locals
+    # of a caller's frame are merely used to resolve forward references.
+    cache_namespaces = (globalns, localns)
     if localns is None:
         if clazz_frame is None:
             clazz_frame = _maybe_get_callers_frame(clazz)
         if clazz_frame is not None:
             localns = clazz_frame.f_locals
-    with _SchemaContext(globalns, localns):
+    token = _schema_ctx_var.set(_SchemaContext(globalns, localns, cache_namespaces))
+    try:
         return _internal_class_schema(clazz, base_schema)
+    finally:
+        _schema_ctx_var.reset(token)
 
 
 class _SchemaContext:
     """Global context for an invocation of class_schema."""
 
+    __slots__ = (
+        "seen_classes",
+        "globalns",
+        "localns",
+        "cache_namespaces",
+        "type_mappings",
+    )
+
     def __init__(
         self,
         globalns: Optional[Dict[str, Any]] = None,
         localns: Optional[Dict[str, Any]] = None,
+        cache_namespaces: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]] = (
+            None,
+            None,
+        ),
     ):
         self.seen_classes: Dict[type, str] = {}
         self.globalns = globalns
         self.localns = localns
+        # Namespaces passed to class_schema; generated schemas are memoized per these
+        self.cache_namespaces = cache_namespaces
+        # Merged TYPE_MAPPINGs, by base schema (see _merged_type_mapping)
+        self.type_mappings: Dict[
+            Optional[Type[marshmallow.Schema]],
+            Dict[Any, Type[marshmallow.fields.Field]],
+        ] = {}
 
-    def __enter__(self) -> "_SchemaContext":
-        _schema_ctx_stack.push(self)
-        return self
 
-    def __exit__(
-        self,
-        _typ: Optional[Type[BaseException]],
-        _value: Optional[BaseException],
-        _tb: Optional[types.TracebackType],
-    ) -> None:
-        _schema_ctx_stack.pop()
+# The _SchemaContext of the class_schema or field_for_schema call in progress
+_schema_ctx_var: ContextVar[_SchemaContext] = ContextVar("_schema_ctx")
 
 
-class _LocalStack(threading.local, Generic[_U]):
-    def __init__(self) -> None:
-        self.stack: List[_U] = []
+# globalns, localns and the schema generated with them
+_SchemaCacheEntry = Tuple[
+    Optional[Dict[str, Any]], Optional[Dict[str, Any]], Type[marshmallow.Schema]
+]
+
 
-    def push(self, value: _U) -> None:
-        self.stack.append(value)
+class _ClassCache:
+    """Schemas generated for a class, memoized on the class itself.
 
-    def pop(self) -> None:
-        self.stack.pop()
+    Storing them on the class, rather than in a global cache, lets them be
+    garbage collected along with the class.
+    """
 
-    @property
-    def top(self) -> _U:
-        return self.stack[-1]
+    __slots__ = ("schemas",)
+
+    def __init__(self) -> None:
+        # Schemas keyed by base schema and the ids of the namespaces passed to
+        # class_schema. Entries hold on to their namespaces, so that their ids
+        # cannot be reused by other namespaces while the entry lives.
+        self.schemas: Dict[Tuple[Any, int, int], _SchemaCacheEntry] = {}
 
 
-_schema_ctx_stack = _LocalStack[_SchemaContext]()
+_CLASS_CACHE_ATTR = "_marshmallow_dataclass_cache"
 
 
-@lru_cache(maxsize=MAX_CLASS_SCHEMA_CACHE_SIZE)
 def _internal_class_schema(
     clazz: type,
     base_schema: Optional[Type[marshmallow.Schema]] = None,
 ) -> Type[marshmallow.Schema]:
-    schema_ctx = _schema_ctx_stack.top
-
-    if typing_extensions.get_origin(clazz) is Annotated and sys.version_info < (3, 10):
+    schema_ctx = _schema_ctx_var.get()
+    # Besides the base schema, schemas are keyed by the namespaces passed to
+    # class_schema, so that call sites with different namespaces do not share results.
+    globalns, localns = schema_ctx.cache_namespaces
+    cache_key = (base_schema, id(globalns), id(localns))
+    # Only classes are memoized: typing aliases forward attribute assignment to
+    # their origin class.
+    is_class = isinstance(clazz, type)
+    if is_class:
+        # Look in the class' own __dict__: subclasses must not reuse their parent's cache
+        class_cache = vars(clazz).get(_CLASS_CACHE_ATTR)
+        if class_cache is not None:
+            entry = class_cache.schemas.get(cache_key)
+            if entry is not None and entry[0] is globalns and entry[1] is localns:
+                return entry[2]
+
+    schema = _build_class_schema(clazz, base_schema, schema_ctx)
+
+    if is_class:
+        # Attached once the build succeeded, which may have memoized it already
+        class_cache = vars(clazz).get(_CLASS_CACHE_ATTR)
+        if class_cache is None:
+            class_cache = _ClassCache()
+            try:
+                setattr(clazz, _CLASS_CACHE_ATTR, class_cache)
+            except (AttributeError, TypeError):
+                # Classes that do not support attribute assignment are not memoized
+                return schema
+        schemas = class_cache.schemas
+        if len(schemas) >= MAX_CLASS_SCHEMA_CACHE_SIZE:
+            # Evict the oldest entry
+            schemas.pop(next(iter(schemas)), None)
+        schemas[cache_key] = (globalns, localns, schema)
+    return schema
+
+
+def _build_class_schema(
+    clazz: type,
+    base_schema: Optional[Type[marshmallow.Schema]],
+    schema_ctx: _SchemaContext,
+) -> Type[marshmallow.Schema]:
+    if get_origin(clazz) is Annotated and sys.version_info < (3, 10):
         # https://github.com/python/cpython/blob/3.10/Lib/typing.py#L977
         class_name = clazz._name or clazz.__origin__.__name__  # type: ignore[attr-defined]
     else:
@@ -546,28 +613,29 @@ def _internal_class_schema(
             ) from exc
 
     # Copy all marshmallow hooks and whitelisted members of the dataclass to the schema.
-    attributes = {
-        k: v
-        for k, v in inspect.getmembers(clazz)
-        if hasattr(v, "__marshmallow_hook__") or k in MEMBERS_WHITELIST
-    }
+    # Walk the class dicts directly rather than using inspect.getmembers(), which
+    # calls getattr() (and so triggers descriptors) on every inherited member.
+    attributes: Dict[str, Any] = {}
+    for base in reversed(clazz.__mro__):
+        for k, v in base.__dict__.items():
+            # Marshmallow's decorators store the hook in the function's own __dict__,
+            # which classmethod and staticmethod objects wrap in __func__
+            func = getattr(v, "__func__", v)
+            if "__marshmallow_hook__" in getattr(func, "__dict__", ()):
+                # Bind descriptors as inspect.getmembers() would
+                attributes[k] = getattr(clazz, k)
+            elif k in MEMBERS_WHITELIST:
+                attributes[k] = v
+            else:
+                # Overridden by a subclass with something that is not a hook
+                attributes.pop(k, None)
 
     # Determine whether we should include non-init fields
     include_non_init = getattr(getattr(clazz, "Meta", None), "include_non_init", False)
 
     # Update the schema members to contain marshmallow fields instead of dataclass fields
 
-    if sys.version_info >= (3, 9):
-        type_hints = get_type_hints(
-            clazz,
-            globalns=schema_ctx.globalns,
-            localns=schema_ctx.localns,
-            include_extras=True,
-        )
-    else:
-        type_hints = get_type_hints(
-            clazz, globalns=schema_ctx.globalns, localns=schema_ctx.localns
-        )
+    type_hints = _get_type_hints(clazz, schema_ctx)
     attributes.update(
         (
             field.name,
@@ -582,16 +650,46 @@ def _internal_class_schema(
         if field.init or include_non_init
     )
 
-    schema_class = type(clazz.__name__, (_base_schema(clazz, base_schema),), attributes)
+    attributes["_marshmallow_dataclass_cls"] = clazz
+    schema_class = type(clazz.__name__, _schema_bases(base_schema), attributes)
     return cast(Type[marshmallow.Schema], schema_class)
 
 
+def _get_type_hints(clazz: type, schema_ctx: _SchemaContext) -> Dict[str, Any]:
+    globalns, localns = schema_ctx.globalns, schema_ctx.localns
+    if sys.version_info >= (3, 9):
+        return get_type_hints(
+            clazz, globalns=globalns, localns=localns, include_extras=True
+        )
+    return get_type_hints(clazz, globalns=globalns, localns=localns)
+
+
+def _merged_type_mapping(
+    base_schema: Optional[Type[marshmallow.Schema]],
+) -> Dict[Any, Type[marshmallow.fields.Field]]:
+    """Return marshmallow's TYPE_MAPPING overridden by that of ``base_schema``.
+
+    The mappings are merged once per base schema and _SchemaContext, so changes
+    to them are picked up by the next class_schema or field_for_schema call.
+    """
+    type_mappings = _schema_ctx_var.get().type_mappings
+    try:
+        return type_mappings[base_schema]
+    except KeyError:
+        pass
+    type_mapping = dict(marshmallow.Schema.TYPE_MAPPING)
+    if base_schema is not None:
+        type_mapping.update(
+            (typ, field) for typ, field in base_schema.TYPE_MAPPING.items() if field
+        )
+    type_mappings[base_schema] = type_mapping
+    return type_mapping
+
+
 def _field_by_type(
     typ: Union[type, Any], base_schema: Optional[Type[marshmallow.Schema]]
 ) -> Optional[Type[marshmallow.fields.Field]]:
-    return (
-        base_schema and base_schema.TYPE_MAPPING.get(typ)
-    ) or marshmallow.Schema.TYPE_MAPPING.get(typ)
+    return _merged_type_mapping(base_schema).get(typ)
 
 
 def _field_by_supertype(
@@ -633,157 +731,264 @@ def _field_by_supertype(
         )
 
 
+# Generic types specified without type arguments, and their equivalent with Any arguments
+_BARE_GENERIC_TYPES: Dict[Any, Any] = {
+    list: List[Any],
+    List: List[Any],
+    dict: Dict[Any, Any],
+    Dict: Dict[Any, Any],
+    Mapping: Mapping[Any, Any],
+    Sequence: Sequence[Any],
+    set: Set[Any],
+    Set: Set[Any],
+    frozenset: FrozenSet[Any],
+    FrozenSet: FrozenSet[Any],
+}
+
+
 def _generic_type_add_any(typ: type) -> type:
     """if typ is generic type without arguments, replace them by Any."""
-    if typ is list or typ is List:
-        typ = List[Any]
-    elif typ is dict or typ is Dict:
-        typ = Dict[Any, Any]
-    elif typ is Mapping:
-        typ = Mapping[Any, Any]
-    elif typ is Sequence:
-        typ = Sequence[Any]
-    elif typ is set or typ is Set:
-        typ = Set[Any]
-    elif typ is frozenset or typ is FrozenSet:
-        typ = FrozenSet[Any]
-    return typ
-
-
-def _field_for_generic_type(
-    typ: type,
+    return _BARE_GENERIC_TYPES.get(typ, typ)
+
+
+def _generic_field_class(
     base_schema: Optional[Type[marshmallow.Schema]],
-    **metadata: Any,
-) -> Optional[marshmallow.fields.Field]:
-    """
-    If the type is a generic interface, resolve the arguments and construct the appropriate Field.
-    """
-    origin = typing_extensions.get_origin(typ)
-    arguments = typing_extensions.get_args(typ)
-    if origin:
-        # Override base_schema.TYPE_MAPPING to change the class used for generic types below
-        type_mapping = base_schema.TYPE_MAPPING if base_schema else {}
-
-        if origin in (list, List):
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            list_type = cast(
-                Type[marshmallow.fields.List],
-                type_mapping.get(List, marshmallow.fields.List),
-            )
-            return list_type(child_type, **metadata)
-        if origin in (collections.abc.Sequence, Sequence) or (
-            origin in (tuple, Tuple)
-            and len(arguments) == 2
-            and arguments[1] is Ellipsis
-        ):
-            from . import collection_field
-
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            return collection_field.Sequence(cls_or_instance=child_type, **metadata)
-        if origin in (set, Set):
-            from . import collection_field
-
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            return collection_field.Set(
-                cls_or_instance=child_type, frozen=False, **metadata
-            )
-        if origin in (frozenset, FrozenSet):
-            from . import collection_field
+    typ: Any,
+    default: Type[marshmallow.fields.Field],
+) -> Type[marshmallow.fields.Field]:
+    """Field class for a generic type, honouring ``base_schema.TYPE_MAPPING`` overrides."""
+    return _merged_type_mapping(base_schema).get(typ, default)
 
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            return collection_field.Set(
-                cls_or_instance=child_type, frozen=True, **metadata
-            )
-        if origin in (tuple, Tuple):
-            children = tuple(
-                _field_for_schema(arg, base_schema=base_schema) for arg in arguments
-            )
-            tuple_type = cast(
-                Type[marshmallow.fields.Tuple],
-                type_mapping.get(  # type:ignore[call-overload]
-                    Tuple, marshmallow.fields.Tuple
-                ),
+
+def _list_field(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    list_type = cast(
+        Type[marshmallow.fields.List],
+        _generic_field_class(base_schema, List, marshmallow.fields.List),
+    )
+    return list_type(child_type, **metadata)
+
+
+def _sequence_field(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    return collection_field.Sequence(cls_or_instance=child_type, **metadata)
+
+
+def _set_field(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    return collection_field.Set(cls_or_instance=child_type, frozen=False, **metadata)
+
+
+def _frozenset_field(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    return collection_field.Set(cls_or_instance=child_type, frozen=True, **metadata)
+
+
+def _tuple_field(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    # Homogeneous tuples, i.e. Tuple[int, ...], are sequences
+    if len(arguments) == 2 and arguments[1] is Ellipsis:
+        return _sequence_field(arguments, base_schema, metadata)
+    children = tuple(
+        _field_for_schema(arg, base_schema=base_schema) for arg in arguments
+    )
+    tuple_type = cast(
+        Type[marshmallow.fields.Tuple],
+        _generic_field_class(base_schema, Tuple, marshmallow.fields.Tuple),
+    )
+    return tuple_type(children, **metadata)
+
+
+def _dict_field(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    dict_type = _generic_field_class(base_schema, Dict, marshmallow.fields.Dict)
+    return dict_type(
+        keys=_field_for_schema(arguments[0], base_schema=base_schema),
+        values=_field_for_schema(arguments[1], base_schema=base_schema),
+        **metadata,
+    )
+
+
+# Field builders for generic types, keyed by the type's origin.
+# Both the builtin/abc and the typing variants are listed, as older
+# pythons do not always normalize the origin of typing generics.
+_GENERIC_FIELD_BUILDERS: Dict[Any, Callable[..., marshmallow.fields.Field]] = {
+    list: _list_field,
+    List: _list_field,
+    collections.abc.Sequence: _sequence_field,
+    Sequence: _sequence_field,
+    set: _set_field,
+    Set: _set_field,
+    frozenset: _frozenset_field,
+    FrozenSet: _frozenset_field,
+    tuple: _tuple_field,
+    Tuple: _tuple_field,
+    dict: _dict_field,
+    Dict: _dict_field,
+    collections.abc.Mapping: _dict_field,
+    Mapping: _dict_field,
+}
+
+
+def _field_for_literal_type(
+    arguments: Tuple[Any, ...],
+    default: Any,
+    metadata: Dict[str, Any],
+    base_schema: Optional[Type[marshmallow.Schema]],
+) -> marshmallow.fields.Field:
+    """i.e.: Literal['abc']"""
+    return marshmallow.fields.Raw(
+        validate=(
+            marshmallow.validate.Equal(arguments[0])
+            if len(arguments) == 1
+            else marshmallow.validate.OneOf(arguments)
+        ),
+        **metadata,
+    )
+
+
+def _field_for_final_type(
+    arguments: Tuple[Any, ...],
+    default: Any,
+    metadata: Dict[str, Any],
+    base_schema: Optional[Type[marshmallow.Schema]],
+) -> marshmallow.fields.Field:
+    """i.e.: Final[str] = 'abc'"""
+    if arguments:
+        subtyp = arguments[0]
+    elif default is not marshmallow.missing:
+        if callable(default):
+            subtyp = Any
+            warnings.warn(
+                "****** WARNING ****** "
+                "marshmallow_dataclass was called on a dataclass with an "
+                'attribute that is type-annotated with "Final" and uses '
+                "dataclasses.field for specifying a default value using a "
+                "factory. The Marshmallow field type cannot be inferred from the "
+                "factory and will fall back to a raw field which is equivalent to "
+                'the type annotation "Any" and will result in no validation. '
+                "Provide a type to Final[...] to ensure accurate validation. "
+                "****** WARNING ******"
             )
-            return tuple_type(children, **metadata)
-        elif origin in (dict, Dict, collections.abc.Mapping, Mapping):
-            dict_type = type_mapping.get(Dict, marshmallow.fields.Dict)
-            return dict_type(
-                keys=_field_for_schema(arguments[0], base_schema=base_schema),
-                values=_field_for_schema(arguments[1], base_schema=base_schema),
-                **metadata,
+        else:
+            subtyp = type(default)
+            warnings.warn(
+                "****** WARNING ****** "
+                "marshmallow_dataclass was called on a dataclass with an "
+                'attribute that is type-annotated with "Final" with a default '
+                "value from which the Marshmallow field type is inferred. "
+                "Support for type inference from a default value is limited and "
+                "may result in inaccurate validation. Provide a type to "
+                "Final[...] to ensure accurate validation. "
+                "****** WARNING ******"
             )
+    else:
+        subtyp = Any
+    return _field_for_schema(subtyp, default, metadata, base_schema)
 
-    return None
+
+# Fields for special typing forms, keyed by the origin of the type
+_SPECIAL_FORM_FIELDS: Dict[Any, Callable[..., marshmallow.fields.Field]] = {
+    Literal: _field_for_literal_type,
+    typing_extensions.Literal: _field_for_literal_type,
+    Final: _field_for_final_type,
+    typing_extensions.Final: _field_for_final_type,
+}
 
 
 def _field_for_annotated_type(
-    typ: type,
+    arguments: Tuple[Any, ...],
     **metadata: Any,
 ) -> Optional[marshmallow.fields.Field]:
     """
-    If the type is an Annotated interface, resolve the arguments and construct the appropriate Field.
+    Given the arguments of an Annotated type, construct the Field it is annotated with, if any.
     """
-    origin = typing_extensions.get_origin(typ)
-    arguments = typing_extensions.get_args(typ)
-    if origin and origin is Annotated:
-        marshmallow_annotations = [
-            arg
-            for arg in arguments[1:]
-            if (inspect.isclass(arg) and issubclass(arg, marshmallow.fields.Field))
-            or isinstance(arg, marshmallow.fields.Field)
-        ]
-        if marshmallow_annotations:
-            if len(marshmallow_annotations) > 1:
-                warnings.warn(
-                    "Multiple marshmallow Field annotations found. Using the last one."
-                )
-
-            field = marshmallow_annotations[-1]
-            # Got a field instance, return as is. User must know what they're doing
-            if isinstance(field, marshmallow.fields.Field):
-                return field
-
-            return field(**metadata)
+    marshmallow_annotations = [
+        arg
+        for arg in arguments[1:]
+        if (isinstance(arg, type) and issubclass(arg, marshmallow.fields.Field))
+        or isinstance(arg, marshmallow.fields.Field)
+    ]
+    if marshmallow_annotations:
+        if len(marshmallow_annotations) > 1:
+            warnings.warn(
+                "Multiple marshmallow Field annotations found. Using the last one."
+            )
+
+        field = marshmallow_annotations[-1]
+        # Got a field instance, return as is. User must know what they're doing
+        if isinstance(field, marshmallow.fields.Field):
+            return field
+
+        return field(**metadata)
     return None
 
 
 def _field_for_union_type(
-    typ: type,
+    arguments: Tuple[Any, ...],
     base_schema: Optional[Type[marshmallow.Schema]],
     **metadata: Any,
-) -> Optional[marshmallow.fields.Field]:
-    arguments = typing_extensions.get_args(typ)
-    if typing_inspect.is_union_type(typ):
-        if typing_inspect.is_optional_type(typ):
-            metadata["allow_none"] = metadata.get("allow_none", True)
-            metadata["dump_default"] = metadata.get("dump_default", None)
-            if not metadata.get("required"):
-                metadata["load_default"] = metadata.get("load_default", None)
-            metadata.setdefault("required", False)
-        subtypes = [t for t in arguments if t is not NoneType]  # type: ignore
-        if len(subtypes) == 1:
+) -> marshmallow.fields.Field:
+    """
+    Construct the Field of a Union, given the arguments of the type.
+    """
+    # Unions are flattened, so a nested Optional shows up as a NoneType argument
+    if NoneType in arguments:
+        metadata["allow_none"] = metadata.get("allow_none", True)
+        metadata["dump_default"] = metadata.get("dump_default", None)
+        if not metadata.get("required"):
+            metadata["load_default"] = metadata.get("load_default", None)
+        metadata.setdefault("required", False)
+        if len(arguments) == 2:
+            # Optional[X]
             return _field_for_schema(
-                subtypes[0],
+                arguments[1] if arguments[0] is NoneType else arguments[0],
                 metadata=metadata,
                 base_schema=base_schema,
             )
-        from . import union_field
-
-        return union_field.Union(
-            [
-                (
-                    subtyp,
-                    _field_for_schema(
-                        subtyp,
-                        metadata={"required": True},
-                        base_schema=base_schema,
-                    ),
-                )
-                for subtyp in subtypes
-            ],
-            **metadata,
+    subtypes = [t for t in arguments if t is not NoneType]  # type: ignore
+    if len(subtypes) == 1:
+        return _field_for_schema(
+            subtypes[0],
+            metadata=metadata,
+            base_schema=base_schema,
         )
-    return None
+    return union_field.Union(
+        [
+            (
+                subtyp,
+                _field_for_schema(
+                    subtyp,
+                    metadata={"required": True},
+                    base_schema=base_schema,
+                ),
+            )
+            for subtyp in subtypes
+        ],
+        **metadata,
+    )
 
 
 def field_for_schema(
@@ -814,8 +1019,13 @@ def field_for_schema(
     >>> field_for_schema(str, metadata={"marshmallow_field": marshmallow.fields.Url()}).__class__
     <class 'marshmallow.fields.Url'>
     """
-    with _SchemaContext(localns=typ_frame.f_locals if typ_frame is not None else None):
+    token = _schema_ctx_var.set(
+        _SchemaContext(localns=typ_frame.f_locals if typ_frame is not None else None)
+    )
+    try:
         return _field_for_schema(typ, default, metadata, base_schema)
+    finally:
+        _schema_ctx_var.reset(token)
 
 
 def _field_for_schema(
@@ -829,7 +1039,7 @@ def _field_for_schema(
     The metadata of the dataclass field is used as arguments to the marshmallow Field.
 
     This is an internal version of field_for_schema. It assumes a _SchemaContext
-    has been pushed onto the local stack.
+    has been set in _schema_ctx_var.
 
     :param typ: The type for which a field should be generated
     :param default: value to use for (de)serialization when the field is missing
@@ -838,7 +1048,11 @@ def _field_for_schema(
 
     """
 
-    metadata = {} if metadata is None else dict(metadata)
+    # Most dataclass fields carry an empty mappingproxy, which dict() copies slowly
+    metadata = dict(metadata) if metadata else {}
+
+    origin = get_origin(typ)
+    arguments = get_args(typ)
 
     if default is not marshmallow.missing:
         metadata.setdefault("dump_default", default)
@@ -846,7 +1060,11 @@ def _field_for_schema(
         if not metadata.get("required"):
             metadata.setdefault("load_default", default)
     else:
-        metadata.setdefault("required", not typing_inspect.is_optional_type(typ))
+        # Unions are flattened, so a nested Optional shows up as a NoneType argument
+        is_optional = typ is NoneType or (
+            origin in _UNION_ORIGINS and NoneType in arguments
+        )
+        metadata.setdefault("required", not is_optional)
 
     # If the field was already defined by the user
     predefined_field = metadata.get("marshmallow_field")
@@ -854,7 +1072,11 @@ def _field_for_schema(
         return predefined_field
 
     # Generic types specified without type arguments
-    typ = _generic_type_add_any(typ)
+    generic_typ = _generic_type_add_any(typ)
+    if generic_typ is not typ:
+        typ = generic_typ
+        origin = get_origin(typ)
+        arguments = get_args(typ)
 
     # Base types
     field = _field_by_type(typ, base_schema)
@@ -865,70 +1087,28 @@ def _field_for_schema(
         metadata.setdefault("allow_none", True)
         return marshmallow.fields.Raw(**metadata)
 
-    # i.e.: Literal['abc']
-    if typing_inspect.is_literal_type(typ):
-        arguments = typing_inspect.get_args(typ)
-        return marshmallow.fields.Raw(
-            validate=(
-                marshmallow.validate.Equal(arguments[0])
-                if len(arguments) == 1
-                else marshmallow.validate.OneOf(arguments)
-            ),
-            **metadata,
-        )
+    # Literal and Final. Bare Final has no origin.
+    special_form_field = _SPECIAL_FORM_FIELDS.get(origin or typ)
+    if special_form_field:
+        return special_form_field(arguments, default, metadata, base_schema)
 
-    # i.e.: Final[str] = 'abc'
-    if typing_inspect.is_final_type(typ):
-        arguments = typing_inspect.get_args(typ)
-        if arguments:
-            subtyp = arguments[0]
-        elif default is not marshmallow.missing:
-            if callable(default):
-                subtyp = Any
-                warnings.warn(
-                    "****** WARNING ****** "
-                    "marshmallow_dataclass was called on a dataclass with an "
-                    'attribute that is type-annotated with "Final" and uses '
-                    "dataclasses.field for specifying a default value using a "
-                    "factory. The Marshmallow field type cannot be inferred from the "
-                    "factory and will fall back to a raw field which is equivalent to "
-                    'the type annotation "Any" and will result in no validation. '
-                    "Provide a type to Final[...] to ensure accurate validation. "
-                    "****** WARNING ******"
-                )
-            else:
-                subtyp = type(default)
-                warnings.warn(
-                    "****** WARNING ****** "
-                    "marshmallow_dataclass was called on a dataclass with an "
-                    'attribute that is type-annotated with "Final" with a default '
-                    "value from which the Marshmallow field type is inferred. "
-                    "Support for type inference from a default value is limited and "
-                    "may result in inaccurate validation. Provide a type to "
-                    "Final[...] to ensure accurate validation. "
-                    "****** WARNING ******"
-                )
-        else:
-            subtyp = Any
-        return _field_for_schema(subtyp, default, metadata, base_schema)
+    if origin is Annotated:
+        annotated_field = _field_for_annotated_type(arguments, **metadata)
+        if annotated_field:
+            return annotated_field
 
-    annotated_field = _field_for_annotated_type(typ, **metadata)
-    if annotated_field:
-        return annotated_field
-
-    union_field = _field_for_union_type(typ, base_schema, **metadata)
-    if union_field:
-        return union_field
+    if origin in _UNION_ORIGINS:
+        return _field_for_union_type(arguments, base_schema, **metadata)
 
     # Generic types
-    generic_field = _field_for_generic_type(typ, base_schema, **metadata)
-    if generic_field:
-        return generic_field
+    generic_field_builder = _GENERIC_FIELD_BUILDERS.get(origin)
+    if generic_field_builder:
+        return generic_field_builder(arguments, base_schema, metadata)
 
     # typing.NewType returns a function (in python <= 3.9) or a class (python >= 3.10) with a
     # __supertype__ attribute
     newtype_supertype = getattr(typ, "__supertype__", None)
-    if typing_inspect.is_new_type(typ) and newtype_supertype is not None:
+    if newtype_supertype is not None and typing_inspect.is_new_type(typ):
         return _field_by_supertype(
             typ=typ,
             default=default,
@@ -938,8 +1118,8 @@ def _field_for_schema(
         )
 
     # enumerations
-    if inspect.isclass(typ) and issubclass(typ, Enum):
-        return marshmallow.fields.Enum(typ, **metadata)
+    if isinstance(typ, EnumMeta):
+        return marshmallow.fields.Enum(cast(Type[Enum], typ), **metadata)
 
     # Nested marshmallow dataclass
     # it would be just a class name instead of actual schema util the schema is not ready yet
@@ -951,33 +1131,47 @@ def _field_for_schema(
     nested = (
         nested_schema
         or forward_reference
-        or _schema_ctx_stack.top.seen_classes.get(typ)
+        or _schema_ctx_var.get().seen_classes.get(typ)
         or _internal_class_schema(typ, base_schema)  # type: ignore[arg-type] # FIXME
     )
 
     return marshmallow.fields.Nested(nested, **metadata)
 
 
-def _base_schema(
-    clazz: type, base_schema: Optional[Type[marshmallow.Schema]] = None
-) -> Type[marshmallow.Schema]:
+class _DataclassSchema(marshmallow.Schema):
     """
-    Base schema factory that creates a schema for `clazz` derived either from `base_schema`
-    or `BaseSchema`
+    Base class of generated schemas, loading data into instances of the
+    dataclass stored in their ``_marshmallow_dataclass_cls`` attribute.
+
+    It is shared by all generated schemas, rather than creating an
+    intermediate schema class per dataclass.
     """
 
-    # Remove `type: ignore` when mypy handles dynamic base classes
-    # https://github.com/python/mypy/issues/2813
-    class BaseSchema(base_schema or marshmallow.Schema):  # type: ignore
-        def load(self, data: Mapping, *, many: Optional[bool] = None, **kwargs):
-            all_loaded = super().load(data, many=many, **kwargs)
-            many = self.many if many is None else bool(many)
-            if many:
-                return [clazz(**loaded) for loaded in all_loaded]
-            else:
-                return clazz(**all_loaded)
+    _marshmallow_dataclass_cls: ClassVar[type]
 
-    return BaseSchema
+    def load(  # type: ignore[override]
+        self, data: Mapping, *, many: Optional[bool] = None, **kwargs
+    ):
+        clazz = self._marshmallow_dataclass_cls
+        all_loaded = super().load(data, many=many, **kwargs)
+        many = self.many if many is None else bool(many)
+        if many:
+            return [clazz(**loaded) for loaded in all_loaded]
+        else:
+            return clazz(**all_loaded)
+
+
+def _schema_bases(
+    base_schema: Optional[Type[marshmallow.Schema]] = None,
+) -> Tuple[Type[marshmallow.Schema], ...]:
+    """
+    Bases of a generated schema: `_DataclassSchema`, followed by `base_schema` if any
+    """
+    if base_schema is None:
+        return (_DataclassSchema,)
+    if issubclass(base_schema, _DataclassSchema):
+        return (base_schema,)
+    return (_DataclassSchema, base_schema)
 
 
 def _get_field_default(field: dataclasses.Field):
@@ -1043,5 +1237,8 @@ def NewType(
 
 if __name__ == "__main__":
     import doctest
+    import os
 
-    doctest.testmod(verbose=True)
+    doctest.testmod(
+        verbose=bool(os.environ.get("MARSHMALLOW_DATACLASS_DOCTEST_VERBOSE"))
+    )
@@ -1,11 +1,13 @@
+import dataclasses
 import sys
 import unittest
+import warnings
 from typing import Optional
 
 import marshmallow
 import marshmallow.fields
 
-from marshmallow_dataclass import dataclass
+from marshmallow_dataclass import class_schema, dataclass
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -35,3 +37,20 @@ class TestAnnotatedField(unittest.TestCase):
 
         with self.assertRaises(marshmallow.exceptions.ValidationError):
             schema.load({"value": "notavalidemail"})
+
+    def test_annotated_dataclass_does_not_reset_schema_cache(self):
+        @dataclasses.dataclass
+        class Foo:
+            x: int
+
+        schema = class_schema(Foo)
+
+        @dataclasses.dataclass
+        class Bar:
+            foo: Annotated[Foo, "doc"]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with self.assertRaises(TypeError):
+                class_schema(Bar)
+        self.assertIs(class_schema(Foo), schema)
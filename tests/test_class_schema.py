@@ -2,6 +2,7 @@ import inspect
 import typing
 import unittest
 from typing import Any, cast, TYPE_CHECKING
+from unittest import mock
 from uuid import UUID
 
 try:
@@ -10,7 +11,7 @@ except ImportError:
     from typing_extensions import Final, Literal  # type: ignore[assignment]
 
 import dataclasses
-from marshmallow import Schema, ValidationError
+from marshmallow import Schema, ValidationError, post_load
 from marshmallow.fields import Field, UUID as UUIDField, List as ListField, Integer
 from marshmallow.validate import Validator
 
@@ -97,6 +98,83 @@ class TestClassSchema(unittest.TestCase):
         self.assertEqual(len(complex_set), 1)
         self.assertEqual(len(simple_set), 1)
 
+    def test_schema_cache_respects_namespaces(self):
+        @dataclasses.dataclass
+        class Outer:
+            inner: "Inner"  # noqa: F821
+
+        @dataclasses.dataclass
+        class IntInner:
+            value: int
+
+        @dataclasses.dataclass
+        class StrInner:
+            value: str
+
+        int_ns = {"Inner": IntInner}
+        str_ns = {"Inner": StrInner}
+
+        int_schema = class_schema(Outer, localns=int_ns)
+        str_schema = class_schema(Outer, localns=str_ns)
+
+        self.assertIsNot(int_schema, str_schema)
+        self.assertIs(int_schema, class_schema(Outer, localns=int_ns))
+        self.assertEqual(
+            int_schema().load({"inner": {"value": "1"}}), Outer(IntInner(1))
+        )
+        self.assertEqual(
+            str_schema().load({"inner": {"value": "1"}}), Outer(StrInner("1"))
+        )
+
+    def test_schema_cache_respects_throwaway_namespaces(self):
+        @dataclasses.dataclass
+        class Outer:
+            inner: "Inner"  # noqa: F821
+
+        @dataclasses.dataclass
+        class IntInner:
+            value: int
+
+        @dataclasses.dataclass
+        class StrInner:
+            value: str
+
+        int_schema = class_schema(Outer, localns={"Inner": IntInner})
+        str_schema = class_schema(Outer, localns={"Inner": StrInner})
+
+        self.assertEqual(
+            int_schema().load({"inner": {"value": "1"}}), Outer(IntInner(1))
+        )
+        self.assertEqual(
+            str_schema().load({"inner": {"value": "1"}}), Outer(StrInner("1"))
+        )
+
+    def test_schema_cache_is_bounded(self):
+        @dataclasses.dataclass
+        class A:
+            value: int
+
+        namespaces = [{}, {}, {}]
+        with mock.patch("marshmallow_dataclass.MAX_CLASS_SCHEMA_CACHE_SIZE", 2):
+            schemas = [class_schema(A, localns=ns) for ns in namespaces]
+            self.assertIs(class_schema(A, localns=namespaces[2]), schemas[2])
+            # The oldest schema has been evicted
+            self.assertIsNot(class_schema(A, localns=namespaces[0]), schemas[0])
+
+    def test_schema_cache_ignores_callers_frame(self):
+        @dataclasses.dataclass
+        class A:
+            value: int
+
+        def get_schemas(depth):
+            # The callers' frames, and so their locals, are all alive at once
+            schema = class_schema(A)
+            return [schema] + (get_schemas(depth - 1) if depth else [])
+
+        schemas = get_schemas(3)
+        self.assertEqual(len(set(schemas)), 1)
+        self.assertIs(schemas[0], class_schema(A))
+
     def test_use_type_mapping_from_base_schema(self):
         class CustomType:
             pass
@@ -123,6 +201,22 @@ class TestClassSchema(unittest.TestCase):
         self.assertIsInstance(schema.fields["uuid"], UUIDField)
         self.assertIsInstance(schema.fields["n"], Integer)
 
+    def test_generated_schema_as_base_schema(self):
+        @dataclasses.dataclass
+        class Base:
+            a: int
+
+        @dataclasses.dataclass
+        class Derived(Base):
+            b: str
+
+        base = class_schema(Base)
+        derived = class_schema(Derived, base_schema=base)
+
+        self.assertTrue(issubclass(derived, base))
+        self.assertEqual(derived().load({"a": 1, "b": "x"}), Derived(a=1, b="x"))
+        self.assertEqual(base().load({"a": 1}), Base(a=1))
+
     def test_filtering_list_schema(self):
         class FilteringListField(ListField):
             def __init__(
@@ -457,6 +551,42 @@ class TestClassSchema(unittest.TestCase):
         self.assertNotIn("no_init", class_schema(NoInit)().fields)
         self.assertIn("no_init", class_schema(Init)().fields)
 
+    def test_inherited_hooks(self):
+        @dataclasses.dataclass
+        class Base:
+            name: str
+
+            @post_load
+            def upper(self, data, **_kwargs):
+                data["name"] = data["name"].upper()
+                return data
+
+            @post_load
+            def exclaim(self, data, **_kwargs):
+                data["name"] += "!"
+                return data
+
+        @dataclasses.dataclass
+        class Child(Base):
+            def exclaim(self, data, **_kwargs):  # no longer a hook
+                return data
+
+        self.assertEqual(class_schema(Base)().load({"name": "a"}), Base(name="A!"))
+        self.assertEqual(class_schema(Child)().load({"name": "a"}), Child(name="A"))
+
+    def test_classmethod_hook(self):
+        @dataclasses.dataclass
+        class A:
+            x: int
+
+            @classmethod
+            @post_load
+            def bump(cls, data, **_kwargs):
+                data["x"] += 10
+                return data
+
+        self.assertEqual(class_schema(A)().load({"x": 1}), A(x=11))
+
 
 if __name__ == "__main__":
     unittest.main()
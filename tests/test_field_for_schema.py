@@ -116,6 +116,28 @@ class TestFieldForSchema(unittest.TestCase):
             ),
         )
 
+    @unittest.skipIf(sys.version_info < (3, 10), "PEP 604 unions need python 3.10")
+    def test_optional_str_pep604(self):
+        self.assertFieldsEqual(
+            field_for_schema(eval("str | None")),
+            fields.String(
+                allow_none=True, required=False, dump_default=None, load_default=None
+            ),
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 10), "PEP 604 unions need python 3.10")
+    def test_union_pep604(self):
+        self.assertFieldsEqual(
+            field_for_schema(eval("int | str")),
+            union_field.Union(
+                [
+                    (int, fields.Integer(required=True)),
+                    (str, fields.String(required=True)),
+                ],
+                required=True,
+            ),
+        )
+
     def test_enum(self):
         class Color(Enum):
             RED: 1
@@ -265,6 +287,18 @@ class TestFieldForSchema(unittest.TestCase):
                 field_for_schema(schema, base_schema=BaseSchema), MyType
             )
 
+    def test_type_mapping_changed_after_first_use(self):
+        class BaseSchema(Schema):
+            TYPE_MAPPING = {}
+
+        self.assertIsInstance(
+            field_for_schema(int, base_schema=BaseSchema), fields.Integer
+        )
+        BaseSchema.TYPE_MAPPING[int] = fields.String
+        self.assertIsInstance(
+            field_for_schema(int, base_schema=BaseSchema), fields.String
+        )
+
     def test_mapping(self):
         self.assertFieldsEqual(
             field_for_schema(typing.Mapping),
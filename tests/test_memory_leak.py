@@ -1,6 +1,7 @@
 import gc
 import inspect
 import sys
+import types
 import unittest
 import weakref
 from dataclasses import dataclass
@@ -84,6 +85,45 @@ class TestMemoryLeak(unittest.TestCase):
         f()
         self.assertFrameCollected()
 
+    def test_class_schema_does_not_keep_class_alive(self):
+        def f():
+            @dataclass
+            class Foo:
+                value: int
+
+                class Meta:
+                    # marshmallow's class registry would keep the schema alive
+                    register = False
+
+            md.class_schema(Foo)
+            return weakref.ref(Foo)
+
+        foo_ref = f()
+        # The class and its memoized schema reference each other
+        gc.collect()
+        self.assertIsNone(foo_ref())
+
+    def test_module_level_class_schema_does_not_keep_class_alive(self):
+        module = types.ModuleType("dynamic_module")
+        with mock.patch.dict(sys.modules, {module.__name__: module}):
+            # At module level, no caller's locals are used to resolve type hints
+            exec(
+                "from dataclasses import dataclass\n"
+                "import marshmallow_dataclass as md\n"
+                "@dataclass\n"
+                "class Foo:\n"
+                "    value: int\n"
+                "    class Meta:\n"
+                "        register = False\n"
+                "md.class_schema(Foo)\n",
+                module.__dict__,
+            )
+        foo_ref = weakref.ref(module.Foo)
+        del module
+
+        gc.collect()
+        self.assertIsNone(foo_ref())
+
     def test_md_dataclass_lazy_schema(self):
         def f():
             @md.dataclass